@@ -0,0 +1,25 @@
+"""Gunicorn configuration for the Bingwa data sales app.
+
+gthread workers so one slow LipaNa round trip only ties up a thread,
+not a whole worker; the STK push itself is already dispatched to a
+background pool, so threads mostly serve fast DB-backed requests.
+Start with: gunicorn -c gunicorn.conf.py app:app
+"""
+import os
+
+bind = '0.0.0.0:' + os.environ.get('PORT', '5000')
+
+worker_class = 'gthread'
+workers = max(2, os.cpu_count() or 1)
+threads = 8
+timeout = 60
+
+# Import the app once in the master so workers fork with the module
+# (and its pre-built package/SQL constants) already loaded. Database
+# connections and the background worker threads are created lazily per
+# worker on the first request via ensure_db(), so nothing stateful
+# crosses the fork.
+preload_app = True
+
+accesslog = None
+errorlog = '-'